@@ -27,21 +27,70 @@ various command line arguments for configuration and uses the Metaphor
 language format for structuring the review request.
 """
 
-import argparse
+from __future__ import annotations
+
+import errno
 import os
 import sys
 from dataclasses import dataclass
-from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# m6rclib is imported where it is needed rather than here, so that short
+# invocations such as --help and --version do not pay for loading the parser.
+if TYPE_CHECKING:
+    from m6rclib import MetaphorASTNode
+
+
+# Fixed blocks of the generated Metaphor content.  These are joined with the
+# per-review Include: and Embed: lines in create_metaphor_content.
+_REVIEW_PREAMBLE = """Role:
+    You are an expert software reviewer, highly skilled in reviewing code written by other engineers.  You are
+    able to provide insightful and useful feedback on how their software might be improved.
+Context: Review guidelines"""
+
+_REVIEW_ACTION_HEADER = """Action: Review code
+    Please review the software described in the files provided here:"""
+
+_REVIEW_ACTION_TRAILER = """    I would like you to summarise how the software works.
+    I would also like you to review each file individually and comment on how it might be improved, based on the
+    guidelines I have provided.  When you do this, you should tell me the name of the file you believe may want to
+    be modified, the modification you believe should happen, and which of the guidelines the change would align with.
+    If any change you envisage might conflict with a guideline then please highlight this and the guideline that might
+    be impacted.
+    The review guidelines include generic guidance that should be applied to all file types, and guidance that should
+    only be applied to a specific language type.  In some cases the specific guidance may not be relevant to the files
+    you are asked to review, and if that's the case you need not mention it.  If, however, there is no specific
+    guideline file for the language in which a file is written then please note that the file has not been reviewed
+    against a detailed guideline.
+    Where useful, I would like you to write new software to show me how any modifications should look."""
+
+
+# Maximum number of guideline directories scanned at the same time.
+_MAX_SCAN_WORKERS = 8
+
 
+def _scan_guideline_dir(path: str) -> Tuple[List[str], Optional[OSError]]:
+    """List the .m6r files in a single directory.
 
-from m6rclib import (
-    MetaphorASTNode,
-    MetaphorParser,
-    MetaphorParserError,
-    format_ast,
-    format_errors,
-)
+    Args:
+        path: Directory to scan
+
+    Returns:
+        Tuple of the files found, sorted by name, and any error raised while
+        scanning.  Errors are returned rather than raised so the caller can
+        report them in search path order.
+    """
+    try:
+        with os.scandir(path) as entries:
+            files = sorted(
+                os.path.join(path, entry.name) for entry in entries
+                if entry.name.endswith('.m6r') and entry.is_file()
+            )
+
+    except OSError as e:
+        return [], e
+
+    return files, None
 
 
 @dataclass
@@ -71,6 +120,9 @@ class MetaphorReviewGenerator:
         """
         self.config = config
         self.guidelines: List[str] = []
+
+        from m6rclib import MetaphorParser
+
         self.parser = MetaphorParser()
 
     def _get_env_guideline_paths(self) -> List[str]:
@@ -92,7 +144,11 @@ class MetaphorReviewGenerator:
             paths: List of paths to search, or None to use current directory
 
         Returns:
-            List of discovered .m6r files
+            List of discovered .m6r files.  Each directory's files are sorted
+            by name and directories are kept in search order, so the same
+            inputs always produce the same list.  A file reached more than
+            once, for example through "dir" and "./dir", is only listed the
+            first time, as the parser rejects a file that is included twice.
 
         Raises:
             SystemExit: If no guideline files are found or on permission errors
@@ -112,31 +168,54 @@ class MetaphorReviewGenerator:
         if not search_paths:
             search_paths = ['.']
 
-        guidelines = []
-        for path in search_paths:
-            try:
-                path_obj = Path(path)
-                if not path_obj.exists():
-                    sys.stderr.write(f"Warning: Path does not exist: {path}\n")
-                    continue
+        # Directories are scanned concurrently when there is more than one, so
+        # slow (e.g. network) filesystems cost the longest latency rather than
+        # the sum of them.  Results are still handled in search order.
+        if len(search_paths) == 1:
+            results = [_scan_guideline_dir(search_paths[0])]
+        else:
+            # Imported here as concurrent.futures pulls in logging, which
+            # would otherwise slow down every invocation.
+            from concurrent.futures import ThreadPoolExecutor
 
-                if not path_obj.is_dir():
-                    sys.stderr.write(f"Warning: Path is not a directory: {path}\n")
-                    continue
+            with ThreadPoolExecutor(max_workers=min(_MAX_SCAN_WORKERS, len(search_paths))) as executor:
+                results = list(executor.map(_scan_guideline_dir, search_paths))
 
-                guidelines.extend(path_obj.glob('*.m6r'))
-
-            except PermissionError as e:
-                sys.stderr.write(f"Error: Permission denied accessing path {path}: {e}\n")
+        guidelines = []
+        for path, (files, error) in zip(search_paths, results):
+            if error is None:
+                guidelines.extend(files)
+                continue
+
+            # As with Path.exists(), a symlink loop or bad descriptor is
+            # treated as the path not existing.
+            if isinstance(error, FileNotFoundError) or error.errno in (errno.ELOOP, errno.EBADF):
+                sys.stderr.write(f"Warning: Path does not exist: {path}\n")
+                continue
+
+            if isinstance(error, NotADirectoryError):
+                sys.stderr.write(f"Warning: Path is not a directory: {path}\n")
+                continue
+
+            if isinstance(error, PermissionError):
+                sys.stderr.write(f"Error: Permission denied accessing path {path}: {error}\n")
                 sys.exit(2)
 
+            sys.stderr.write(f"Warning: Cannot read path {path}: {error}\n")
+
         if not guidelines:
             sys.stderr.write(
                 f"Error: No .m6r files found in search paths: {', '.join(search_paths)}\n"
             )
             sys.exit(2)
 
-        return [str(p) for p in guidelines]
+        # Compare on the canonical path, as the parser does, but keep the
+        # path as it was found.
+        unique_guidelines = {}
+        for guideline in guidelines:
+            unique_guidelines.setdefault(os.path.realpath(guideline), guideline)
+
+        return list(unique_guidelines.values())
 
     def validate_files(self, files: List[str]) -> None:
         """Validate that all input files exist and are readable.
@@ -148,12 +227,11 @@ class MetaphorReviewGenerator:
             SystemExit: If any file cannot be accessed
         """
         for file in files:
-            path = Path(file)
-            if not path.is_file():
+            if not os.path.isfile(file):
                 sys.stderr.write(f"Error: Cannot open input file: {file}\n")
                 sys.exit(3)
 
-            if not os.access(path, os.R_OK):
+            if not os.access(file, os.R_OK):
                 sys.stderr.write(f"Error: No read permission for file: {file}\n")
                 sys.exit(3)
 
@@ -167,29 +245,12 @@ class MetaphorReviewGenerator:
         Returns:
             String containing the complete Metaphor content
         """
-        include_lines = '\n'.join(f'    Include: {g}' for g in guidelines)
-        embed_lines = '\n'.join(f'    Embed: {f}' for f in files)
-
-        return f"""Role:
-    You are an expert software reviewer, highly skilled in reviewing code written by other engineers.  You are
-    able to provide insightful and useful feedback on how their software might be improved.
-Context: Review guidelines
-{include_lines}
-Action: Review code
-    Please review the software described in the files provided here:
-{embed_lines}
-    I would like you to summarise how the software works.
-    I would also like you to review each file individually and comment on how it might be improved, based on the
-    guidelines I have provided.  When you do this, you should tell me the name of the file you believe may want to
-    be modified, the modification you believe should happen, and which of the guidelines the change would align with.
-    If any change you envisage might conflict with a guideline then please highlight this and the guideline that might
-    be impacted.
-    The review guidelines include generic guidance that should be applied to all file types, and guidance that should
-    only be applied to a specific language type.  In some cases the specific guidance may not be relevant to the files
-    you are asked to review, and if that's the case you need not mention it.  If, however, there is no specific
-    guideline file for the language in which a file is written then please note that the file has not been reviewed
-    against a detailed guideline.
-    Where useful, I would like you to write new software to show me how any modifications should look."""
+        parts = [_REVIEW_PREAMBLE]
+        parts.extend(f'    Include: {g}' for g in guidelines)
+        parts.append(_REVIEW_ACTION_HEADER)
+        parts.extend(f'    Embed: {f}' for f in files)
+        parts.append(_REVIEW_ACTION_TRAILER)
+        return '\n'.join(parts)
 
     def write_output(self, content: str, output_file: Optional[str]) -> None:
         """Write content to the specified output file or stdout.
@@ -232,6 +293,13 @@ Action: Review code
             SystemExit: If review generation fails
         """
         content = self.create_metaphor_content(self.guidelines, self.config.input_files)
+
+        from m6rclib import (
+            MetaphorParserError,
+            format_ast,
+            format_errors,
+        )
+
         try:
             ast: MetaphorASTNode = self.parser.parse(
                 content,
@@ -244,12 +312,92 @@ Action: Review code
             sys.exit(2)
 
 
-def parse_arguments() -> ReviewConfiguration:
+# Options understood by _scan_arguments, mapped to their ReviewConfiguration fields.
+_FAST_OPTIONS: Dict[str, str] = {
+    '-o': 'output_file',
+    '--output': 'output_file',
+    '-g': 'guideline_paths',
+    '--guideline-dir': 'guideline_paths',
+}
+
+
+def _scan_arguments(argv: List[str]) -> Optional[ReviewConfiguration]:
+    """Parse the common forms of command line without using argparse.
+
+    Only the -o/--output and -g/--guideline-dir options, in either their
+    separate or "--option=value" forms, and file arguments are handled.
+    Anything else, including help and version requests, is left to
+    argparse so that its help text and error reporting are unchanged.
+
+    Args:
+        argv: Command line arguments, excluding the program name
+
+    Returns:
+        ReviewConfiguration for the arguments, or None if argparse is needed
+    """
+    output_file: Optional[str] = None
+    guideline_paths: List[str] = []
+    input_files: List[str] = []
+    files_ended = False
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if not arg.startswith('-') or arg == '-':
+            # argparse requires the file arguments to be contiguous.
+            if files_ended:
+                return None
+
+            input_files.append(arg)
+            continue
+
+        if input_files:
+            files_ended = True
+
+        name, sep, value = arg.partition('=')
+        field = _FAST_OPTIONS.get(name)
+        if field is None or (sep and not name.startswith('--')):
+            return None
+
+        if not sep:
+            if i >= len(argv) or argv[i].startswith('-'):
+                return None
+
+            value = argv[i]
+            i += 1
+
+        if field == 'output_file':
+            output_file = value
+        else:
+            guideline_paths.append(value)
+
+    return ReviewConfiguration(
+        output_file=output_file,
+        guideline_paths=guideline_paths or None,
+        input_files=input_files
+    )
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> ReviewConfiguration:
     """Parse and validate command line arguments.
 
+    Args:
+        argv: Command line arguments, excluding the program name, or None to
+            use sys.argv
+
     Returns:
         ReviewConfiguration containing the parsed arguments
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    config = _scan_arguments(argv)
+    if config is not None:
+        return config
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Generate AI-assisted code reviews using Metaphor templates'
     )
@@ -277,7 +425,7 @@ def parse_arguments() -> ReviewConfiguration:
         nargs='*'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     return ReviewConfiguration(
         output_file=args.output,
         guideline_paths=args.guideline_paths,